@@ -1,13 +1,11 @@
 import pandas as pd
+import numpy as np
 
-def aggregate_team_stats(input_csv_path, output_csv_path):
+def compute_team_stats(df):
     """
-    Aggregate football match statistics by team, converting home/away metrics 
+    Average match statistics by team, converting home/away metrics 
     to self/rival perspective for each team.
     """
-    # Read the CSV file
-    df = pd.read_csv(input_csv_path)
-    
     # Initialize list to store all team records
     team_records = []
     
@@ -81,7 +79,44 @@ def aggregate_team_stats(input_csv_path, output_csv_path):
     }).round(2)
     
     # Reset index to make team a column
-    team_stats = team_stats.reset_index()
+    return team_stats.reset_index()
+
+def compute_positions(df):
+    """
+    League table from match results: teams ordered by points, 
+    goal difference and goals scored.
+    """
+    home = pd.DataFrame({
+        'team': df['home_team'],
+        'goals_for': df['goals_home'],
+        'goals_against': df['goals_away'],
+    })
+    away = pd.DataFrame({
+        'team': df['away_team'],
+        'goals_for': df['goals_away'],
+        'goals_against': df['goals_home'],
+    })
+    results = pd.concat([home, away], ignore_index=True)
+    results['points'] = np.select(
+        [results['goals_for'] > results['goals_against'], results['goals_for'] == results['goals_against']],
+        [3, 1],
+        default=0
+    )
+    results['goal_difference'] = results['goals_for'] - results['goals_against']
+    
+    table = results.groupby('team')[['points', 'goal_difference', 'goals_for']].sum()
+    table = table.sort_values(['points', 'goal_difference', 'goals_for'], ascending=False)
+    return table.index.tolist()
+
+def aggregate_team_stats(input_csv_path, output_csv_path):
+    """
+    Aggregate football match statistics by team, converting home/away metrics 
+    to self/rival perspective for each team.
+    """
+    # Read the CSV file
+    df = pd.read_csv(input_csv_path)
+    
+    team_stats = compute_team_stats(df)
     
     # Save to CSV
     team_stats.to_csv(output_csv_path, index=False)
@@ -3,6 +3,10 @@ import numpy as np
 from sklearn.cluster import KMeans
 from sklearn.preprocessing import StandardScaler
 import matplotlib.pyplot as plt
+from profile_projection import get_feature_columns, load_or_fit_projection
+
+# Cluster in a lower-dimensional projection of the profiles (see profile_projection.py)
+use_projection = False
 
 # Read the CSV file
 df = pd.read_csv('data/second_round_with_stats.csv')
@@ -11,12 +15,19 @@ df = pd.read_csv('data/second_round_with_stats.csv')
 df['match_id'] = df['home_team'] + ' vs ' + df['away_team']
 
 # Select only numerical features for clustering (excluding team names and positions)
-feature_cols = [col for col in df.columns if col not in ['home_team', 'away_team', 'match_id']]
+feature_cols = get_feature_columns(df)
 X = df[feature_cols]
 
 # Standardize the features (important for k-means)
-scaler = StandardScaler()
-X_scaled = scaler.fit_transform(X)
+if use_projection:
+    # Scaler and projection are fitted once and cached
+    scaler, projection = load_or_fit_projection(X)
+    X_scaled = projection.transform(scaler.transform(X))
+    print(f"Projected {len(feature_cols)} features onto {projection.n_components_} components "
+          f"({projection.explained_variance_ratio_.sum():.1%} of variance)")
+else:
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(X)
 
 # Determine optimal number of clusters using elbow method
 inertias = []
@@ -43,7 +54,10 @@ kmeans = KMeans(n_clusters=optimal_k, random_state=42, n_init=10)
 df['cluster'] = kmeans.fit_predict(X_scaled)
 
 # Add cluster centers (in original scale)
-cluster_centers = scaler.inverse_transform(kmeans.cluster_centers_)
+centers_scaled = kmeans.cluster_centers_
+if use_projection:
+    centers_scaled = projection.inverse_transform(centers_scaled)
+cluster_centers = scaler.inverse_transform(centers_scaled)
 centers_df = pd.DataFrame(cluster_centers, columns=feature_cols)
 centers_df.index = [f'Cluster {i}' for i in range(optimal_k)]
 
@@ -1,31 +1,24 @@
 import pandas as pd
 
-def merge_football_data(stats_file, positions_file, matches_file, output_file):
+def build_match_profiles(team_stats, positions_list, matches, ratings=None):
     """
-    Merge three CSV files: team stats, team positions, and matches data.
+    Build one profile row per match from the team stats and positions of both teams.
     
     Args:
-        stats_file (str): Path to team statistics CSV
-        positions_file (str): Path to team positions text file (one team per line)
-        matches_file (str): Path to matches CSV
-        output_file (str): Path for output CSV
+        team_stats (DataFrame): Team statistics (one row per team)
+        positions_list (list): Team names ordered by league position
+        matches (DataFrame): Matches with home_team, away_team and date
+        ratings (DataFrame): Optional pre-match team ratings (see team_ratings.py)
     """
     
-    # Read the team statistics CSV
-    team_stats = pd.read_csv(stats_file)
-    
-    # Read the positions file (simple text file with team names)
-    with open(positions_file, 'r', encoding='utf-8') as f:
-        positions_list = [line.strip() for line in f.readlines() if line.strip()]
-    
     # Create positions dataframe with position numbers (1-indexed)
     positions_df = pd.DataFrame({
         'team': positions_list,
         'position': range(1, len(positions_list) + 1)
     })
     
-    # Read matches CSV, keeping only home_team and away_team columns
-    matches = pd.read_csv(matches_file)[['home_team', 'away_team']]
+    # Keep only the teams and the match date
+    matches = matches[['home_team', 'away_team', 'date']]
     
     # Add home and away positions
     matches = matches.merge(
@@ -55,6 +48,42 @@ def merge_football_data(stats_file, positions_file, matches_file, output_file):
     
     matches = matches.merge(away_stats, on='away_team', how='left')
     
+    # Add the pre-match ratings of both teams
+    if ratings is not None:
+        ratings = ratings[['home_team', 'away_team', 'date', 'elo_home', 'elo_away']]
+        matches = matches.merge(ratings, on=['home_team', 'away_team', 'date'], how='left')
+    
+    # The date is only needed to join the ratings
+    matches = matches.drop(columns=['date'])
+    
+    return matches
+
+def merge_football_data(stats_file, positions_file, matches_file, output_file, ratings_file=None):
+    """
+    Merge three CSV files: team stats, team positions, and matches data.
+    
+    Args:
+        stats_file (str): Path to team statistics CSV
+        positions_file (str): Path to team positions text file (one team per line)
+        matches_file (str): Path to matches CSV
+        output_file (str): Path for output CSV
+        ratings_file (str): Optional pre-match team ratings CSV (see team_ratings.py)
+    """
+    
+    # Read the team statistics CSV
+    team_stats = pd.read_csv(stats_file)
+    
+    # Read the positions file (simple text file with team names)
+    with open(positions_file, 'r', encoding='utf-8') as f:
+        positions_list = [line.strip() for line in f.readlines() if line.strip()]
+    
+    # Read matches CSV
+    matches = pd.read_csv(matches_file)
+    
+    ratings = pd.read_csv(ratings_file) if ratings_file else None
+    
+    matches = build_match_profiles(team_stats, positions_list, matches, ratings)
+    
     # Save the result
     matches.to_csv(output_file, index=False)
     print(f"Merged data saved to {output_file}")
@@ -76,9 +105,10 @@ if __name__ == "__main__":
     positions_file = "data/positions_after_first_round.csv" 
     matches_file = "data/second_round.csv"
     output_file = "data/second_round_with_stats.csv"
+    ratings_file = None  # e.g. "data/team_ratings.csv" to add Elo ratings to the profiles
     
     try:
-        result = merge_football_data(stats_file, positions_file, matches_file, output_file)
+        result = merge_football_data(stats_file, positions_file, matches_file, output_file, ratings_file)
     except FileNotFoundError as e:
         print(f"Error: File not found - {e}")
         print("Please make sure all input files exist in the correct paths")
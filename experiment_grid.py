@@ -0,0 +1,188 @@
+import os
+import time
+import itertools
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+import numpy as np
+from sklearn.cluster import KMeans
+from sklearn.metrics import silhouette_score
+from sklearn.preprocessing import StandardScaler, MinMaxScaler, RobustScaler
+from aggregations_by_team import compute_team_stats, compute_positions
+from create_match_profiles import build_match_profiles
+from feature_store import write_feature_store, FeatureStore
+
+SCALERS = {
+    'standard': StandardScaler,
+    'minmax': MinMaxScaler,
+    'robust': RobustScaler,
+}
+
+
+# Feature subsets: each one selects columns from the full profile column list.
+# They are plain module-level functions so they can be sent to worker processes.
+def all_features(cols):
+    return cols
+
+def without_positions(cols):
+    return [col for col in cols if col not in ['home_position', 'away_position']]
+
+def attack_features(cols):
+    attack = ('goles_', 'goals_', 'tiros_', 'avg_corners_', 'avg_posesion_')
+    return [col for col in cols if col.startswith(attack)]
+
+def discipline_features(cols):
+    discipline = ('amarillas_', 'rojas_', 'fouls_')
+    return [col for col in cols if col.startswith(discipline)]
+
+FEATURE_SETS = {
+    'all': all_features,
+    'no_positions': without_positions,
+    'attack': attack_features,
+    'discipline': discipline_features,
+}
+
+
+def build_cutoff_profiles(season_df, cutoff_date, store_dir):
+    """
+    Split the season at the cutoff and build the second-round match profiles
+    from first-round team averages and positions (same steps as the scripts).
+    The profiles are written to a feature store that the workers attach to.
+    """
+    first_round = season_df[season_df['date'] <= cutoff_date]
+    second_round = season_df[season_df['date'] > cutoff_date]
+
+    team_stats = compute_team_stats(first_round)
+    positions_list = compute_positions(first_round)
+    profiles = build_match_profiles(team_stats, positions_list, second_round)
+    return write_feature_store(profiles, store_dir)
+
+
+def team_concentration(home_code, away_code, labels):
+    """
+    Mean share of each team's matches that fall in its most frequent cluster
+    (1.0 means every team always plays the same kind of match).
+    """
+    teams = np.concatenate([home_code, away_code])
+    clusters = np.concatenate([labels, labels])
+    counts = pd.crosstab(teams, clusters)
+    return (counts.max(axis=1) / counts.sum(axis=1)).mean()
+
+
+def run_configuration(store_dir, cutoff_date, feature_set, scaler_name, k_values):
+    """
+    Scale the selected features once and run the clustering and prevalence
+    steps for every k. Returns one result row per k.
+    """
+    store = FeatureStore(store_dir)
+    feature_cols = FEATURE_SETS[feature_set](store.columns)
+    columns = store.column_index(feature_cols)
+
+    # Teams without first-round matches have no averages
+    complete = ~np.isnan(store.X_raw[:, columns]).any(axis=1)
+    home_code, away_code = store.home_code[complete], store.away_code[complete]
+
+    if scaler_name == 'standard' and complete.all():
+        # Already standardized in the store
+        X_scaled = store.X[:, columns]
+    else:
+        X_scaled = SCALERS[scaler_name]().fit_transform(store.X_raw[complete][:, columns])
+
+    results = []
+    for k in k_values:
+        if k >= len(X_scaled):
+            continue
+        start = time.perf_counter()
+        kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
+        labels = kmeans.fit_predict(X_scaled)
+        elapsed = time.perf_counter() - start
+
+        sizes = np.bincount(labels, minlength=k)
+        results.append({
+            'cutoff_date': cutoff_date,
+            'feature_set': feature_set,
+            'scaler': scaler_name,
+            'k': k,
+            'n_matches': len(X_scaled),
+            'n_features': len(feature_cols),
+            'inertia': kmeans.inertia_,
+            'silhouette': silhouette_score(X_scaled, labels),
+            'min_cluster_size': sizes.min(),
+            'max_cluster_size': sizes.max(),
+            'team_concentration': team_concentration(home_code, away_code, labels),
+            'fit_seconds': elapsed,
+        })
+    return results
+
+
+def run_experiment_grid(season_file, cutoff_dates, feature_sets, scalers, k_values,
+                        output_file=None, max_workers=None):
+    """
+    Run the profile -> scale -> cluster -> prevalence steps over a grid of settings.
+
+    Profiles are built once per cutoff and written to a feature store, and the
+    scaled matrix is built once per (cutoff, feature set, scaler); the k values
+    reuse it. Both stages run on a process pool and workers attach to the
+    stores by path instead of receiving a copy of the profiles.
+
+    Args:
+        season_file: Processed season CSV (e.g. processed_football_stats.csv)
+        cutoff_dates: Dates splitting first and second round ("YYYY-MM-DD")
+        feature_sets: Names from FEATURE_SETS
+        scalers: Names from SCALERS
+        k_values: Numbers of clusters
+        output_file: Optional CSV for the results table
+        max_workers: Size of the process pool (defaults to the CPU count)
+
+    Returns:
+        DataFrame with one row per combination, e.g. filter it with
+        results.query("scaler == 'standard' and k == 5")
+    """
+    season_df = pd.read_csv(season_file)
+
+    with tempfile.TemporaryDirectory() as tmp_dir, ProcessPoolExecutor(max_workers=max_workers) as pool:
+        # Shared intermediate results: one feature store per cutoff
+        store_dirs = [os.path.join(tmp_dir, f"cutoff_{i}") for i in range(len(cutoff_dates))]
+        stores = dict(zip(
+            cutoff_dates,
+            pool.map(build_cutoff_profiles, itertools.repeat(season_df), cutoff_dates, store_dirs)
+        ))
+
+        futures = [
+            pool.submit(run_configuration, stores[cutoff], cutoff, feature_set, scaler, list(k_values))
+            for cutoff, feature_set, scaler in itertools.product(cutoff_dates, feature_sets, scalers)
+        ]
+        rows = [row for future in futures for row in future.result()]
+
+    results = pd.DataFrame(rows)
+
+    if output_file:
+        results.to_csv(output_file, index=False)
+        print(f"Experiment results saved to {output_file}")
+
+    return results
+
+
+# Example usage
+if __name__ == "__main__":
+    season_file = "data/processed_football_stats.csv"
+    output_file = "data/experiment_results.csv"
+
+    cutoff_dates = ["2022-11-13", "2023-01-05", "2023-02-26"]
+    k_values = range(2, 9)
+
+    start = time.perf_counter()
+    results = run_experiment_grid(
+        season_file,
+        cutoff_dates,
+        feature_sets=list(FEATURE_SETS),
+        scalers=list(SCALERS),
+        k_values=k_values,
+        output_file=output_file,
+        max_workers=os.cpu_count(),
+    )
+    print(f"Ran {len(results)} configurations in {time.perf_counter() - start:.1f}s")
+
+    print("\nBest silhouette per cutoff:")
+    best = results.loc[results.groupby('cutoff_date')['silhouette'].idxmax()]
+    print(best[['cutoff_date', 'feature_set', 'scaler', 'k', 'silhouette', 'team_concentration']].to_string(index=False))
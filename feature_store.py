@@ -0,0 +1,155 @@
+import os
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+import numpy as np
+from sklearn.cluster import KMeans
+from profile_projection import get_feature_columns
+
+STORE_DIR = 'data/feature_store'
+MANIFEST = 'manifest.json'
+
+
+def write_feature_store(profiles, store_dir=STORE_DIR):
+    """
+    Write the match profiles once as .npy files plus a JSON manifest.
+
+    The store holds the raw and standardized profile matrices, the home/away
+    team codes and the column and team names, so workers can attach to it
+    with memory mapping instead of reloading the CSV or receiving a copy.
+
+    Args:
+        profiles: Match profiles DataFrame (e.g. second_round_with_stats.csv)
+        store_dir: Directory for the store (created if missing)
+    """
+    os.makedirs(store_dir, exist_ok=True)
+
+    columns = get_feature_columns(profiles)
+    X_raw = profiles[columns].to_numpy(dtype=np.float64)
+
+    # Same standardization as StandardScaler; teams without stats stay NaN
+    mean = np.nanmean(X_raw, axis=0)
+    scale = np.nanstd(X_raw, axis=0)
+    scale[scale == 0] = 1.0
+    X_scaled = (X_raw - mean) / scale
+
+    teams = sorted(set(profiles['home_team']) | set(profiles['away_team']))
+    codes = {team: code for code, team in enumerate(teams)}
+    arrays = {
+        'profiles_raw': X_raw,
+        'profiles_scaled': X_scaled,
+        'home_code': profiles['home_team'].map(codes).to_numpy(dtype=np.int32),
+        'away_code': profiles['away_team'].map(codes).to_numpy(dtype=np.int32),
+    }
+
+    for name, array in arrays.items():
+        np.save(os.path.join(store_dir, f"{name}.npy"), array)
+
+    # The manifest is written last, so a store without one is incomplete
+    manifest = {
+        'n_matches': len(profiles),
+        'columns': columns,
+        'teams': teams,
+        'mean': mean.tolist(),
+        'scale': scale.tolist(),
+        'arrays': {name: {'shape': list(array.shape), 'dtype': str(array.dtype)}
+                   for name, array in arrays.items()},
+    }
+    with open(os.path.join(store_dir, MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    return store_dir
+
+
+class FeatureStore:
+    """
+    Read-only view of a feature store written by write_feature_store.
+
+    The arrays are memory-mapped, so attaching is nearly instant and every
+    process attached to the same store shares the same pages.
+    """
+
+    def __init__(self, store_dir=STORE_DIR):
+        self.store_dir = store_dir
+        with open(os.path.join(store_dir, MANIFEST), 'r', encoding='utf-8') as f:
+            self.manifest = json.load(f)
+
+        self.columns = self.manifest['columns']
+        self.teams = np.array(self.manifest['teams'])
+        self.mean = np.array(self.manifest['mean'])
+        self.scale = np.array(self.manifest['scale'])
+
+        self.X_raw = self._attach('profiles_raw')
+        self.X = self._attach('profiles_scaled')
+        self.home_code = self._attach('home_code')
+        self.away_code = self._attach('away_code')
+
+    def _attach(self, name):
+        array = np.load(os.path.join(self.store_dir, f"{name}.npy"), mmap_mode='r')
+        expected = self.manifest['arrays'][name]
+        if list(array.shape) != expected['shape'] or str(array.dtype) != expected['dtype']:
+            raise ValueError(f"Feature store array '{name}' does not match its manifest")
+        return array
+
+    def __len__(self):
+        return self.manifest['n_matches']
+
+    def column_index(self, columns):
+        """Positions of the given column names in the profile matrix"""
+        return [self.columns.index(col) for col in columns]
+
+    @property
+    def home_team(self):
+        return self.teams[self.home_code]
+
+    @property
+    def away_team(self):
+        return self.teams[self.away_code]
+
+    @property
+    def match_id(self):
+        return np.char.add(np.char.add(self.home_team, ' vs '), self.away_team)
+
+    def team_frame(self):
+        """Match identifiers as a DataFrame, aligned with the matrix rows"""
+        return pd.DataFrame({
+            'match_id': self.match_id,
+            'home_team': self.home_team,
+            'away_team': self.away_team,
+        })
+
+
+def _worker_team_cluster_counts(store_dir, n_clusters):
+    """Example worker: attaches to the store, clusters and counts team appearances per cluster"""
+    start = time.perf_counter()
+    store = FeatureStore(store_dir)
+    attach_seconds = time.perf_counter() - start
+
+    labels = KMeans(n_clusters=n_clusters, random_state=42, n_init=10).fit_predict(store.X)
+
+    counts = np.zeros((len(store.teams), n_clusters), dtype=np.int64)
+    np.add.at(counts, (store.home_code, labels), 1)
+    np.add.at(counts, (store.away_code, labels), 1)
+    return attach_seconds, counts
+
+
+# Example usage
+if __name__ == "__main__":
+    profiles = pd.read_csv('data/second_round_with_stats.csv')
+
+    start = time.perf_counter()
+    write_feature_store(profiles)
+    print(f"Feature store written to '{STORE_DIR}' in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    start = time.perf_counter()
+    store = FeatureStore()
+    print(f"Attached in {(time.perf_counter() - start) * 1000:.2f}ms: "
+          f"{len(store)} matches x {len(store.columns)} features, {len(store.teams)} teams")
+
+    # Workers only receive the store path, never a copy of the matrix
+    for n_workers in [1, 2, 4, 8]:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            results = list(pool.map(_worker_team_cluster_counts, [STORE_DIR] * n_workers, [5] * n_workers))
+        attach_ms = max(attach for attach, _ in results) * 1000
+        print(f"{n_workers} workers: slowest attach {attach_ms:.2f}ms")
@@ -0,0 +1,176 @@
+import time
+import pandas as pd
+import numpy as np
+from sklearn.linear_model import LogisticRegression, PoissonRegressor
+from sklearn.metrics import log_loss, accuracy_score
+from profile_projection import get_feature_columns
+
+MODEL_FILE = 'data/outcome_model.npz'
+
+# Outcome classes: home win, draw, away win
+OUTCOMES = ['home', 'draw', 'away']
+
+
+def build_training_set(profiles_file, results_file):
+    """
+    Join the match profiles (built only from information available before
+    each match) with the actual results.
+
+    Returns:
+        DataFrame with the profile columns plus date, outcome and total_goals
+    """
+    profiles = pd.read_csv(profiles_file)
+    results = pd.read_csv(results_file)[['home_team', 'away_team', 'date', 'goals_home', 'goals_away']]
+
+    # Each fixture is played once per season, so the teams identify the match
+    df = profiles.merge(results, on=['home_team', 'away_team'], how='inner')
+
+    df['outcome'] = np.select(
+        [df['goals_home'] > df['goals_away'], df['goals_home'] == df['goals_away']],
+        [0, 1],
+        default=2
+    )
+    df['total_goals'] = df['goals_home'] + df['goals_away']
+    return df.drop(columns=['goals_home', 'goals_away']).sort_values('date').reset_index(drop=True)
+
+
+class OutcomeModel:
+    """
+    Lightweight outcome model over match profiles: a multinomial logistic
+    regression for home/draw/away and a Poisson regression for total goals.
+
+    Only the standardization and the linear coefficients are kept, so
+    scoring is a couple of matrix products over the whole batch.
+    """
+
+    def __init__(self, feature_cols, mean, scale, outcome_coef, outcome_intercept, goals_coef, goals_intercept):
+        self.feature_cols = list(feature_cols)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.outcome_coef = np.asarray(outcome_coef, dtype=np.float64)
+        self.outcome_intercept = np.asarray(outcome_intercept, dtype=np.float64)
+        self.goals_coef = np.asarray(goals_coef, dtype=np.float64)
+        self.goals_intercept = float(goals_intercept)
+
+    @classmethod
+    def fit(cls, training_set, C=0.1, alpha=1.0):
+        """
+        Fit both models on a training set from build_training_set.
+
+        Args:
+            training_set: Profiles with outcome and total_goals columns
+            C: Inverse regularization strength of the outcome model
+            alpha: Regularization strength of the goals model
+        """
+        feature_cols = [col for col in get_feature_columns(training_set)
+                        if col not in ['date', 'outcome', 'total_goals']]
+        training_set = training_set.dropna(subset=feature_cols)
+        X = training_set[feature_cols].to_numpy(dtype=np.float64)
+
+        mean = X.mean(axis=0)
+        scale = X.std(axis=0)
+        scale[scale == 0] = 1.0
+        X_scaled = (X - mean) / scale
+
+        y_outcome = training_set['outcome'].to_numpy()
+        if sorted(np.unique(y_outcome)) != [0, 1, 2]:
+            raise ValueError("Training set must contain home wins, draws and away wins")
+        outcome_model = LogisticRegression(C=C, max_iter=1000).fit(X_scaled, y_outcome)
+        goals_model = PoissonRegressor(alpha=alpha, max_iter=1000).fit(X_scaled, training_set['total_goals'])
+
+        return cls(feature_cols, mean, scale, outcome_model.coef_, outcome_model.intercept_,
+                   goals_model.coef_, goals_model.intercept_)
+
+    def score(self, profiles):
+        """
+        Score a batch of fixtures in one vectorized call.
+
+        Args:
+            profiles: DataFrame with the model's profile columns
+
+        Returns:
+            DataFrame with p_home, p_draw, p_away and expected_goals per fixture
+        """
+        X = (profiles[self.feature_cols].to_numpy(dtype=np.float64) - self.mean) / self.scale
+
+        logits = X @ self.outcome_coef.T + self.outcome_intercept
+        logits -= logits.max(axis=1, keepdims=True)
+        probs = np.exp(logits)
+        probs /= probs.sum(axis=1, keepdims=True)
+
+        expected_goals = np.exp(X @ self.goals_coef + self.goals_intercept)
+
+        return pd.DataFrame({
+            'p_home': probs[:, 0],
+            'p_draw': probs[:, 1],
+            'p_away': probs[:, 2],
+            'expected_goals': expected_goals,
+        }, index=profiles.index)
+
+    def save(self, path=MODEL_FILE):
+        np.savez(
+            path,
+            feature_cols=np.array(self.feature_cols, dtype=str),
+            mean=self.mean,
+            scale=self.scale,
+            outcome_coef=self.outcome_coef,
+            outcome_intercept=self.outcome_intercept,
+            goals_coef=self.goals_coef,
+            goals_intercept=self.goals_intercept,
+        )
+
+    @classmethod
+    def load(cls, path=MODEL_FILE):
+        with np.load(path) as data:
+            return cls(data['feature_cols'].tolist(), data['mean'], data['scale'],
+                       data['outcome_coef'], data['outcome_intercept'],
+                       data['goals_coef'], data['goals_intercept'])
+
+
+def benchmark_scoring(model, profiles, n_fixtures=10000, repeats=20):
+    """
+    Measure the latency of scoring a batch of n_fixtures profiles.
+
+    Returns:
+        Median seconds per score() call
+    """
+    reps = int(np.ceil(n_fixtures / len(profiles)))
+    batch = pd.concat([profiles] * reps, ignore_index=True).iloc[:n_fixtures]
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        model.score(batch)
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings))
+
+
+# Example usage
+if __name__ == "__main__":
+    profiles_file = "data/second_round_with_stats.csv"
+    results_file = "data/processed_football_stats.csv"
+
+    training_set = build_training_set(profiles_file, results_file)
+    print(f"Training set: {len(training_set)} matches")
+
+    # Chronological holdout: fit on the earlier matches, evaluate on the last 20%
+    split = int(len(training_set) * 0.8)
+    train, test = training_set.iloc[:split], training_set.iloc[split:]
+    model = OutcomeModel.fit(train)
+    scores = model.score(test)
+
+    probs = scores[['p_home', 'p_draw', 'p_away']].to_numpy()
+    print(f"\nHoldout ({len(test)} matches):")
+    print(f"  Outcome log loss: {log_loss(test['outcome'], probs, labels=[0, 1, 2]):.3f}")
+    print(f"  Outcome accuracy: {accuracy_score(test['outcome'], probs.argmax(axis=1)):.1%}")
+    print(f"  Total goals MAE: {np.abs(scores['expected_goals'] - test['total_goals']).mean():.2f}")
+
+    # Final model on all matches
+    model = OutcomeModel.fit(training_set)
+    model.save()
+    model = OutcomeModel.load()
+    print(f"\nModel saved to '{MODEL_FILE}'")
+
+    for n_fixtures in [1000, 10000, 100000]:
+        latency = benchmark_scoring(model, training_set, n_fixtures)
+        print(f"Scoring {n_fixtures:>6d} fixtures: {latency * 1000:.2f}ms")
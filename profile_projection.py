@@ -0,0 +1,149 @@
+import os
+import time
+import joblib
+import pandas as pd
+import numpy as np
+from sklearn.cluster import KMeans
+from sklearn.decomposition import PCA
+from sklearn.metrics import adjusted_rand_score
+from sklearn.preprocessing import StandardScaler
+
+PROJECTION_CACHE = 'data/profile_projection.joblib'
+
+
+def get_feature_columns(df):
+    """Numerical profile columns used for clustering (everything except the team columns)"""
+    return [col for col in df.columns if col not in ['home_team', 'away_team', 'match_id']]
+
+
+def fit_projection(X_scaled, method='pca', n_components=0.95, random_state=42):
+    """
+    Fit a projection of the standardized match profiles onto fewer dimensions.
+
+    Args:
+        X_scaled: Standardized feature matrix
+        method: 'pca' (exact) or 'randomized' (randomized SVD, needs an int n_components)
+        n_components: Number of components, or fraction of variance to keep for 'pca'
+        random_state: Seed for the randomized solver
+    """
+    if method == 'pca':
+        projection = PCA(n_components=n_components, svd_solver='full')
+    elif method == 'randomized':
+        if not isinstance(n_components, int):
+            raise ValueError("Randomized SVD needs an integer number of components")
+        projection = PCA(n_components=n_components, svd_solver='randomized', random_state=random_state)
+    else:
+        raise ValueError(f"Unknown projection method: {method}")
+
+    projection.fit(X_scaled)
+    return projection
+
+
+def _data_fingerprint(X):
+    """Cheap fingerprint of the feature matrix so a stale cache is not reused"""
+    return int(pd.util.hash_pandas_object(X, index=False).sum())
+
+
+def load_or_fit_projection(X, cache_path=PROJECTION_CACHE, method='pca', n_components=0.95):
+    """
+    Return a (scaler, projection) pair fitted on the raw profile features X.
+
+    The pair is cached with joblib and only refitted when the features,
+    the data or the projection settings change.
+    """
+    feature_cols = list(X.columns)
+    fingerprint = _data_fingerprint(X)
+
+    if os.path.exists(cache_path):
+        cached = joblib.load(cache_path)
+        if (cached['feature_cols'] == feature_cols and cached['fingerprint'] == fingerprint
+                and cached['method'] == method and cached['n_components'] == n_components):
+            return cached['scaler'], cached['projection']
+
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(X)
+    projection = fit_projection(X_scaled, method=method, n_components=n_components)
+
+    joblib.dump({
+        'feature_cols': feature_cols,
+        'fingerprint': fingerprint,
+        'method': method,
+        'n_components': n_components,
+        'scaler': scaler,
+        'projection': projection,
+    }, cache_path)
+
+    return scaler, projection
+
+
+def _time_k_sweep(X, k_range):
+    start = time.perf_counter()
+    for k in k_range:
+        KMeans(n_clusters=k, random_state=42, n_init=10).fit(X)
+    return time.perf_counter() - start
+
+
+def _time_assignment(kmeans, X, n_rows, repeats=5):
+    # Tile the profiles to simulate a large batch of fixtures
+    reps = int(np.ceil(n_rows / len(X)))
+    batch = np.tile(X, (reps, 1))[:n_rows]
+    start = time.perf_counter()
+    for _ in range(repeats):
+        kmeans.predict(batch)
+    return (time.perf_counter() - start) / repeats
+
+
+def compare_with_full_model(X_scaled, projection, k_range=range(2, 11), optimal_k=5, batch_size=100000):
+    """
+    Compare clustering in the projected space with the full-feature model.
+
+    Returns a dict with the explained variance, the adjusted Rand index between
+    both labelings, and the timings of the k-sweep and of batch assignment.
+    """
+    X_proj = projection.transform(X_scaled)
+
+    full_kmeans = KMeans(n_clusters=optimal_k, random_state=42, n_init=10).fit(X_scaled)
+    proj_kmeans = KMeans(n_clusters=optimal_k, random_state=42, n_init=10).fit(X_proj)
+
+    sweep_full = _time_k_sweep(X_scaled, k_range)
+    sweep_proj = _time_k_sweep(X_proj, k_range)
+    assign_full = _time_assignment(full_kmeans, X_scaled, batch_size)
+    assign_proj = _time_assignment(proj_kmeans, X_proj, batch_size)
+
+    return {
+        'n_features': X_scaled.shape[1],
+        'n_components': projection.n_components_,
+        'explained_variance': projection.explained_variance_ratio_.sum(),
+        'explained_variance_ratio': projection.explained_variance_ratio_,
+        'adjusted_rand_index': adjusted_rand_score(full_kmeans.labels_, proj_kmeans.labels_),
+        'k_sweep_full_s': sweep_full,
+        'k_sweep_projected_s': sweep_proj,
+        'k_sweep_speedup': sweep_full / sweep_proj,
+        'assignment_full_s': assign_full,
+        'assignment_projected_s': assign_proj,
+        'assignment_speedup': assign_full / assign_proj,
+    }
+
+
+# Example usage
+if __name__ == "__main__":
+    df = pd.read_csv('data/second_round_with_stats.csv')
+    X = df[get_feature_columns(df)]
+
+    scaler, projection = load_or_fit_projection(X)
+    X_scaled = scaler.transform(X)
+
+    report = compare_with_full_model(X_scaled, projection)
+
+    print("=" * 60)
+    print("PROJECTED CLUSTERING REPORT")
+    print("=" * 60)
+    print(f"Features: {report['n_features']} -> Components: {report['n_components']}")
+    print(f"Explained variance: {report['explained_variance']:.1%}")
+    print("Per component: " + ", ".join(f"{v:.1%}" for v in report['explained_variance_ratio']))
+    print(f"\nCluster agreement with full-feature model (ARI): {report['adjusted_rand_index']:.3f}")
+    print(f"\nk-sweep: {report['k_sweep_full_s']:.2f}s full, {report['k_sweep_projected_s']:.2f}s projected "
+          f"({report['k_sweep_speedup']:.1f}x)")
+    print(f"Batch assignment: {report['assignment_full_s'] * 1000:.1f}ms full, "
+          f"{report['assignment_projected_s'] * 1000:.1f}ms projected ({report['assignment_speedup']:.1f}x)")
+    print(f"\nScaler and projection cached in '{PROJECTION_CACHE}'")
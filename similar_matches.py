@@ -0,0 +1,158 @@
+import time
+import pandas as pd
+import numpy as np
+from profile_projection import get_feature_columns
+
+INDEX_FILE = 'data/similar_matches_index.npz'
+
+
+class MatchSimilarityIndex:
+    """
+    Exact nearest-neighbour index over standardized match profiles.
+
+    The index keeps the standardization parameters it was built with, so new
+    matches and query fixtures are projected into the same space. Queries run
+    as blocked brute force in NumPy, which stays exact and makes appending new
+    matches trivial.
+    """
+
+    def __init__(self, feature_cols, mean, scale):
+        self.feature_cols = list(feature_cols)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.vectors = np.empty((0, len(self.feature_cols)), dtype=np.float64)
+        self.sq_norms = np.empty(0, dtype=np.float64)
+        self.match_ids = np.empty(0, dtype=str)
+        self.home_teams = np.empty(0, dtype=str)
+        self.away_teams = np.empty(0, dtype=str)
+
+    def __len__(self):
+        return len(self.vectors)
+
+    @classmethod
+    def build(cls, profiles):
+        """Fit the standardization on the profiles (same as cluster_matches.py) and index them"""
+        feature_cols = get_feature_columns(profiles)
+        X = profiles[feature_cols].to_numpy(dtype=np.float64)
+        mean = X.mean(axis=0)
+        scale = X.std(axis=0)
+        scale[scale == 0] = 1.0  # constant columns, as StandardScaler does
+
+        index = cls(feature_cols, mean, scale)
+        index.add(profiles)
+        return index
+
+    @classmethod
+    def from_feature_store(cls, store):
+        """Index the matches of a FeatureStore, reusing its standardized matrix"""
+        index = cls(store.columns, store.mean, store.scale)
+        index.vectors = np.asarray(store.X)
+        index.sq_norms = np.einsum('ij,ij->i', index.vectors, index.vectors)
+        index.match_ids = store.match_id
+        index.home_teams = store.home_team
+        index.away_teams = store.away_team
+        return index
+
+    def transform(self, profiles):
+        """Standardize profile rows with the parameters stored in the index"""
+        X = profiles[self.feature_cols].to_numpy(dtype=np.float64)
+        return (X - self.mean) / self.scale
+
+    def add(self, profiles):
+        """Append newly processed matches to the index"""
+        vectors = self.transform(profiles)
+        match_ids = (profiles['home_team'] + ' vs ' + profiles['away_team']).to_numpy(dtype=str)
+
+        self.vectors = np.vstack([self.vectors, vectors])
+        self.sq_norms = np.concatenate([self.sq_norms, np.einsum('ij,ij->i', vectors, vectors)])
+        self.match_ids = np.concatenate([self.match_ids, match_ids])
+        self.home_teams = np.concatenate([self.home_teams, profiles['home_team'].to_numpy(dtype=str)])
+        self.away_teams = np.concatenate([self.away_teams, profiles['away_team'].to_numpy(dtype=str)])
+
+    def query(self, fixtures, k=5, max_block_cells=2 ** 24):
+        """
+        Find the k most similar historical matches for each fixture.
+
+        Args:
+            fixtures: DataFrame with the same profile columns as the index
+            k: Number of neighbours per fixture
+            max_block_cells: Upper bound on the size of each distance block
+
+        Returns:
+            DataFrame with one row per (fixture, neighbour), ordered by distance
+        """
+        k = min(k, len(self))
+        Q = self.transform(fixtures)
+        q_sq_norms = np.einsum('ij,ij->i', Q, Q)
+        block_size = max(1, max_block_cells // max(len(self), 1))
+
+        neighbours = np.empty((len(Q), k), dtype=np.int64)
+        distances = np.empty((len(Q), k), dtype=np.float64)
+
+        for start in range(0, len(Q), block_size):
+            stop = start + block_size
+            # Squared euclidean distances via ||q||^2 + ||v||^2 - 2 q.v
+            d2 = q_sq_norms[start:stop, None] + self.sq_norms[None, :] - 2.0 * Q[start:stop] @ self.vectors.T
+            np.maximum(d2, 0.0, out=d2)
+
+            top = np.argpartition(d2, k - 1, axis=1)[:, :k]
+            top_d2 = np.take_along_axis(d2, top, axis=1)
+            order = np.argsort(top_d2, axis=1)
+            neighbours[start:stop] = np.take_along_axis(top, order, axis=1)
+            distances[start:stop] = np.sqrt(np.take_along_axis(top_d2, order, axis=1))
+
+        flat = neighbours.ravel()
+        return pd.DataFrame({
+            'fixture': np.repeat(np.arange(len(Q)), k),
+            'rank': np.tile(np.arange(1, k + 1), len(Q)),
+            'match_id': self.match_ids[flat],
+            'home_team': self.home_teams[flat],
+            'away_team': self.away_teams[flat],
+            'distance': distances.ravel(),
+        })
+
+    def save(self, path=INDEX_FILE):
+        np.savez(
+            path,
+            feature_cols=np.array(self.feature_cols, dtype=str),
+            mean=self.mean,
+            scale=self.scale,
+            vectors=self.vectors,
+            match_ids=self.match_ids,
+            home_teams=self.home_teams,
+            away_teams=self.away_teams,
+        )
+
+    @classmethod
+    def load(cls, path=INDEX_FILE):
+        with np.load(path) as data:
+            index = cls(data['feature_cols'].tolist(), data['mean'], data['scale'])
+            index.vectors = data['vectors']
+            index.match_ids = data['match_ids']
+            index.home_teams = data['home_teams']
+            index.away_teams = data['away_teams']
+        index.sq_norms = np.einsum('ij,ij->i', index.vectors, index.vectors)
+        return index
+
+
+# Example usage
+if __name__ == "__main__":
+    profiles = pd.read_csv('data/second_round_with_stats.csv')
+
+    index = MatchSimilarityIndex.build(profiles)
+    index.save()
+    index = MatchSimilarityIndex.load()
+    print(f"Indexed {len(index)} matches with {len(index.feature_cols)} features -> '{INDEX_FILE}'")
+
+    # Use the last few profiles as "upcoming" fixtures
+    fixtures = profiles.tail(5).reset_index(drop=True)
+    start = time.perf_counter()
+    neighbours = index.query(fixtures, k=4)
+    elapsed = time.perf_counter() - start
+
+    for i, row in fixtures.iterrows():
+        print(f"\n{row['home_team']} vs {row['away_team']}:")
+        for _, n in neighbours[neighbours['fixture'] == i].iterrows():
+            print(f"  {int(n['rank'])}. {n['match_id']:35s} (distance {n['distance']:.2f})")
+
+    print(f"\nQueried {len(fixtures)} fixtures in {elapsed * 1000:.2f}ms")
@@ -0,0 +1,156 @@
+import os
+import json
+import pandas as pd
+import numpy as np
+
+
+def goal_difference_multiplier(goal_diff):
+    """Weight of the rating update by margin of victory (World Football Elo)"""
+    goal_diff = abs(goal_diff)
+    if goal_diff <= 1:
+        return 1.0
+    if goal_diff == 2:
+        return 1.5
+    return (11 + goal_diff) / 8
+
+
+class EloRatings:
+    """
+    Incremental Elo-style team ratings.
+
+    Matches are processed in chronological order and each one gets the
+    ratings both teams had *before* kick-off. The state (ratings and number
+    of matches already seen) can be saved and reloaded, so appending a new
+    matchday only processes the new rows.
+    """
+
+    def __init__(self, k_factor=20.0, home_advantage=60.0, initial_rating=1500.0):
+        self.k_factor = k_factor
+        self.home_advantage = home_advantage
+        self.initial_rating = initial_rating
+        self.ratings = {}
+        self.n_processed = 0
+        self.last_date = None
+
+    def process(self, matches):
+        """
+        Update the ratings with a chronologically sorted batch of matches.
+
+        Args:
+            matches: DataFrame with home_team, away_team, date, goals_home, goals_away
+
+        Returns:
+            DataFrame with the pre-match ratings of both teams for every match
+        """
+        if len(matches) == 0:
+            return pd.DataFrame(columns=['home_team', 'away_team', 'date', 'elo_home', 'elo_away',
+                                         'elo_diff', 'elo_expected_home'])
+
+        dates = pd.to_datetime(matches['date'])
+        if self.last_date is not None and dates.iloc[0] < pd.Timestamp(self.last_date):
+            raise ValueError(f"Matches before {self.last_date} were already processed")
+
+        home_teams = matches['home_team'].tolist()
+        away_teams = matches['away_team'].tolist()
+        goal_diffs = (matches['goals_home'] - matches['goals_away']).tolist()
+
+        n = len(matches)
+        elo_home = np.empty(n)
+        elo_away = np.empty(n)
+        expected_home = np.empty(n)
+
+        ratings = self.ratings
+        initial = self.initial_rating
+        for i in range(n):
+            home_rating = ratings.get(home_teams[i], initial)
+            away_rating = ratings.get(away_teams[i], initial)
+            expected = 1.0 / (1.0 + 10 ** ((away_rating - home_rating - self.home_advantage) / 400))
+
+            elo_home[i] = home_rating
+            elo_away[i] = away_rating
+            expected_home[i] = expected
+
+            goal_diff = goal_diffs[i]
+            score = 1.0 if goal_diff > 0 else (0.5 if goal_diff == 0 else 0.0)
+            change = self.k_factor * goal_difference_multiplier(goal_diff) * (score - expected)
+            ratings[home_teams[i]] = home_rating + change
+            ratings[away_teams[i]] = away_rating - change
+
+        self.n_processed += n
+        self.last_date = str(dates.iloc[-1].date())
+
+        return pd.DataFrame({
+            'home_team': home_teams,
+            'away_team': away_teams,
+            'date': matches['date'].tolist(),
+            'elo_home': elo_home.round(1),
+            'elo_away': elo_away.round(1),
+            'elo_diff': (elo_home - elo_away).round(1),
+            'elo_expected_home': expected_home.round(4),
+        })
+
+    def save_state(self, state_file):
+        with open(state_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'k_factor': self.k_factor,
+                'home_advantage': self.home_advantage,
+                'initial_rating': self.initial_rating,
+                'n_processed': self.n_processed,
+                'last_date': self.last_date,
+                'ratings': self.ratings,
+            }, f, indent=2)
+
+    @classmethod
+    def load_state(cls, state_file):
+        with open(state_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        engine = cls(state['k_factor'], state['home_advantage'], state['initial_rating'])
+        engine.n_processed = state['n_processed']
+        engine.last_date = state['last_date']
+        engine.ratings = state['ratings']
+        return engine
+
+
+def update_team_ratings(matches_file, state_file, output_file):
+    """
+    Compute pre-match ratings for the matches not yet processed.
+
+    Args:
+        matches_file: Processed matches CSV sorted by date (e.g. processed_football_stats.csv)
+        state_file: JSON file with the saved rating state (created if missing)
+        output_file: CSV with one row of pre-match ratings per match (appended to)
+    """
+    if os.path.exists(state_file) and os.path.exists(output_file):
+        engine = EloRatings.load_state(state_file)
+    else:
+        engine = EloRatings()
+
+    matches = pd.read_csv(matches_file)
+    new_matches = matches.iloc[engine.n_processed:]
+    print(f"{len(matches)} matches, {len(new_matches)} new since last update")
+
+    ratings_df = engine.process(new_matches)
+
+    if engine.n_processed > len(new_matches):
+        ratings_df.to_csv(output_file, mode='a', header=False, index=False)
+    else:
+        ratings_df.to_csv(output_file, index=False)
+    engine.save_state(state_file)
+
+    print(f"Pre-match ratings saved to {output_file}")
+    print(f"Rating state saved to {state_file}")
+
+    return engine
+
+
+# Example usage
+if __name__ == "__main__":
+    matches_file = "data/processed_football_stats.csv"
+    state_file = "data/team_ratings_state.json"
+    output_file = "data/team_ratings.csv"
+
+    engine = update_team_ratings(matches_file, state_file, output_file)
+
+    print("\nCurrent ratings:")
+    table = pd.Series(engine.ratings).sort_values(ascending=False).round(1)
+    print(table.to_string())